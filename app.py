@@ -5,10 +5,10 @@ A Data Trust Gate before ETL / BI / ML pipelines.
 Run: streamlit run app.py
 """
 
+import hashlib
+
 import streamlit as st
 import pandas as pd
-import plotly.express as px
-import plotly.graph_objects as go
 from io import StringIO
 
 from edet.input_layer import load_dataset, create_profile
@@ -48,6 +48,8 @@ with st.sidebar:
         type=["csv", "xlsx", "xls", "json", "txt", "tsv"],
     )
     if uploaded:
+        # Content fingerprint: keys the evaluation cache (the DataFrame itself is not hashed)
+        digest = hashlib.blake2b(uploaded.getvalue(), digest_size=16).hexdigest()
         try:
             df, file_type = load_dataset(uploaded, file_type=None)
             st.success(f"Loaded: {len(df):,} rows × {len(df.columns)} columns ({file_type})")
@@ -65,13 +67,13 @@ if df is None:
 
 # Run pipeline
 @st.cache_data(show_spinner="Running EDET evaluation...")
-def run_edet(_df: pd.DataFrame, _file_type: str):
-    profile = create_profile(_df, _file_type)
+def run_edet(digest: str, _df: pd.DataFrame, file_type: str):
+    profile = create_profile(_df, file_type)
     engine = TrustEngine()
     return profile, engine.evaluate(profile)
 
 with st.spinner("Evaluating dataset..."):
-    profile, bundle = run_edet(df, file_type or "unknown")
+    profile, bundle = run_edet(digest, df, file_type or "unknown")
 
 t = bundle.trust
 if not t:
@@ -103,19 +105,7 @@ st.caption("0.80–1.00 Decision-Ready | 0.60–0.79 Review Recommended | 0.40
 
 # Risk heatmap
 st.subheader("Risk heatmap by category")
-fig_heat = go.Figure(data=go.Bar(
-    x=list(t.risk_heatmap.keys()),
-    y=list(t.risk_heatmap.values()),
-    marker_color=px.colors.sequential.Reds[::-1][:6],
-))
-fig_heat.update_layout(
-    xaxis_title="Category",
-    yaxis_title="Risk (0–1)",
-    template="plotly_white",
-    height=320,
-    margin=dict(t=20, b=40),
-)
-st.plotly_chart(fig_heat, use_container_width=True)
+st.bar_chart(pd.Series(t.risk_heatmap, name="Risk (0–1)"), color="#dc2626", height=320)
 
 # Section 2 — Structural Reliability
 st.header("2. Structural Reliability")
@@ -178,19 +168,7 @@ st.metric("Analytics Utility Score", f"{ar.analytics_utility_score:.2f}")
 
 # Component scores chart
 st.subheader("Component scores (trust breakdown)")
-fig_comp = go.Figure(data=go.Bar(
-    x=list(t.component_scores.keys()),
-    y=list(t.component_scores.values()),
-    marker_color="#3b82f6",
-))
-fig_comp.update_layout(
-    xaxis_tickangle=-45,
-    yaxis_range=[0, 1.05],
-    template="plotly_white",
-    height=320,
-    margin=dict(t=20, b=80),
-)
-st.plotly_chart(fig_comp, use_container_width=True)
+st.bar_chart(pd.Series(t.component_scores, name="Score (0–1)"), color="#3b82f6", height=320)
 
 # Downloadable Executive Summary
 st.header("Download Executive Summary")
@@ -2,42 +2,61 @@
 
 from __future__ import annotations
 
+from importlib.util import find_spec
+
 import pandas as pd
 import numpy as np
-from scipy import stats
 
 from edet.models.profile import DatasetProfile
 from edet.models.scores import AnalyticalResult
 
-try:
-    from sklearn.ensemble import IsolationForest
-    from sklearn.preprocessing import StandardScaler
-    HAS_SKLEARN = True
-except ImportError:
-    HAS_SKLEARN = False
+# sklearn is imported on first use to keep cold start light
+HAS_SKLEARN = find_spec("sklearn") is not None
+
+# Anomaly density is a proportion, so a random subsample estimates it well
+ANOMALY_MAX_ROWS = 50_000
+
+# Below these sizes the statistic is degenerate or not meaningful, so the
+# computation is skipped rather than paid for
+VIF_MIN_COLUMNS = 3
+VIF_MIN_ROWS = 20
+ANOMALY_MIN_COLUMNS = 2
+ANOMALY_MIN_ROWS = 100  # contamination=0.1 needs enough rows to mean anything
+ENTROPY_MAX_NULL_FRACTION = 0.9
+
+# Relative residual variance below which a column counts as an exact linear
+# combination of the others (VIF inf); also the conditioning limit for inv()
+VIF_SINGULAR_TOL = 1e-10
 
 
-def _vif(df: pd.DataFrame) -> dict[str, float]:
-    """Variance inflation factor for numeric columns."""
-    num = df.select_dtypes(include=[np.number]).dropna(axis=1, how="all")
-    if num.shape[1] < 2:
+def _vif(X: np.ndarray, columns: list[str]) -> dict[str, float]:
+    """
+    Variance inflation factor for the columns of a median-filled numeric block.
+
+    VIF_i is the i-th diagonal entry of the inverse correlation matrix, so all
+    columns are covered by one k x k inverse instead of k regressions. For an
+    ill-conditioned matrix the pseudo-inverse is used instead, and a column is
+    only given VIF inf when its residual on the other columns is actually ~0.
+    """
+    with np.errstate(invalid="ignore"):  # inf columns: NaN std, dropped as in pandas
+        keep = ~np.isnan(X).any(axis=0) & (X.std(axis=0) > 0)  # drops all-null and constant columns
+    if keep.sum() < 2:
         return {}
-    from numpy.linalg import LinAlgError
-    vifs = {}
-    for i, col in enumerate(num.columns):
-        try:
-            y = num.iloc[:, i]
-            X = num.drop(columns=[col])
-            X = X.loc[:, X.std() > 0]
-            if X.shape[1] == 0:
-                continue
-            from sklearn.linear_model import LinearRegression
-            r2 = LinearRegression().fit(X, y).score(X, y)
-            vif = 1 / (1 - r2) if r2 < 1 else np.inf
-            vifs[col] = vif
-        except (LinAlgError, ValueError):
-            continue
-    return vifs
+    Z = X[:, keep]
+    corr = np.corrcoef(Z, rowvar=False)
+    if np.linalg.cond(corr) < 1 / VIF_SINGULAR_TOL:
+        return dict(zip(np.asarray(columns)[keep].tolist(), np.diag(np.linalg.inv(corr)).tolist()))
+
+    vifs = np.diag(np.linalg.pinv(corr, hermitian=True)).copy()
+    Z = Z - Z.mean(axis=0)
+    for i in range(Z.shape[1]):
+        y = Z[:, i]
+        others = np.delete(Z, i, axis=1)
+        beta = np.linalg.lstsq(others, y, rcond=None)[0]
+        resid = y - others @ beta
+        if resid @ resid <= VIF_SINGULAR_TOL * (y @ y):
+            vifs[i] = np.inf  # exactly explained by the other columns
+    return dict(zip(np.asarray(columns)[keep].tolist(), vifs.tolist()))
 
 
 def evaluate_analytical(profile: DatasetProfile) -> AnalyticalResult:
@@ -47,14 +66,12 @@ def evaluate_analytical(profile: DatasetProfile) -> AnalyticalResult:
     """
     df = profile.df
     n_rows, n_cols = df.shape
-    low_var: list[str] = []
-    high_skew: list[str] = []
     high_vif: list[str] = []
     utility_score = 1.0
     prep_complexity = 0.0
     anomaly_density: float | None = None
 
-    numeric = df.select_dtypes(include=[np.number])
+    numeric = df[profile.numeric_cols]
     if numeric.empty:
         return AnalyticalResult(
             analytics_utility_score=0.5,
@@ -65,40 +82,80 @@ def evaluate_analytical(profile: DatasetProfile) -> AnalyticalResult:
             anomaly_density=None,
         )
 
-    # Variance sufficiency
-    for c in numeric.columns:
-        std = numeric[c].std()
-        if std == 0 or (std < 1e-10 and numeric[c].abs().max() > 1e-10):
-            low_var.append(c)
-        elif numeric[c].std() < numeric[c].mean() * 0.01 and numeric[c].mean() != 0:
-            low_var.append(c)
+    # Variance sufficiency and skewness: one vectorized sweep over all columns
+    arr = numeric.to_numpy(dtype=np.float64, na_value=np.nan)
+    cols = numeric.columns.to_numpy()
+    # All-null and single-value columns have no defined statistics: they are
+    # left NaN, which the masks below treat as "not flagged", instead of being
+    # passed to the nan-reductions (which warn on them)
+    present = ~np.isnan(arr)
+    n_present = present.sum(axis=0)
+    mean, std, abs_max = (np.full(len(cols), np.nan) for _ in range(3))
+    with np.errstate(divide="ignore", invalid="ignore", over="ignore"):
+        some = n_present >= 1
+        if some.any():
+            sub = arr if some.all() else arr[:, some]
+            mean[some] = np.nanmean(sub, axis=0)
+            abs_max[some] = np.fmax(np.nanmax(sub, axis=0), -np.nanmin(sub, axis=0))  # no N x k |arr| temporary
+        several = n_present >= 2
+        if several.any():
+            std[several] = np.nanstd(arr if several.all() else arr[:, several], axis=0, ddof=1)
+        low_var_mask = (
+            (std == 0)
+            | ((std < 1e-10) & (abs_max > 1e-10))
+            | ((std < mean * 0.01) & (mean != 0))
+        )
+        # Skew only where it can be flagged: not low-variance, and at least 3
+        # values. Biased m3 / m2**1.5 as scipy.stats.skew (NaN where m2 is lost
+        # to rounding), computed here since scipy warns on near-constant columns
+        skew = np.zeros(len(cols))
+        skewed = ~low_var_mask & (n_present >= 3)
+        if skewed.any():
+            d = np.where(present[:, skewed], arr[:, skewed] - mean[skewed], 0.0)
+            n = n_present[skewed]
+            m2 = (d * d).sum(axis=0) / n
+            m3 = (d * d * d).sum(axis=0) / n
+            lost = m2 <= (np.finfo(np.float64).eps * mean[skewed]) ** 2
+            skew[skewed] = np.where(lost, np.nan, m3 / m2**1.5)
+    low_var = cols[low_var_mask].tolist()
     if low_var:
         utility_score -= 0.1 * min(len(low_var), 5)
         prep_complexity += 0.1 * len(low_var)
 
-    # Skewness
-    for c in numeric.columns:
-        if c in low_var:
-            continue
-        sk = stats.skew(numeric[c].dropna())
-        if abs(sk) > 2:
-            high_skew.append(c)
+    high_skew = cols[(np.abs(skew) > 2) & ~low_var_mask].tolist()
     if high_skew:
         utility_score -= 0.05 * min(len(high_skew), 4)
         prep_complexity += 0.05 * len(high_skew)
 
-    # Categorical entropy (diversity)
-    obj = df.select_dtypes(include=["object", "string"])
-    for c in obj.columns:
-        vc = df[c].value_counts(normalize=True)
-        ent = -np.sum(vc * np.log2(vc + 1e-10))
-        max_ent = np.log2(len(vc)) if len(vc) > 1 else 1
-        if max_ent > 0 and ent / max_ent < 0.1:
+    # Categorical entropy (diversity); factorize + bincount counts without sorting
+    null_fraction = dict(zip(df.columns, profile.null_mask.mean(axis=0))) if n_rows else {}
+    for c in profile.object_cols:
+        if null_fraction.get(c, 1.0) > ENTROPY_MAX_NULL_FRACTION:
+            continue  # mostly empty: already counted in the missing burden
+        codes, _ = pd.factorize(df[c], sort=False)
+        counts = np.bincount(codes[codes >= 0])
+        if len(counts) <= 1:
+            prep_complexity += 0.05  # constant or empty: no diversity
+            continue
+        if len(counts) == counts.sum():
+            continue  # all distinct: maximal entropy
+        p = counts / counts.sum()
+        ent = -np.sum(p * np.log2(p + 1e-10))
+        if ent / np.log2(len(counts)) < 0.1:
             prep_complexity += 0.05  # low diversity
 
+    # Median-filled, C-contiguous copy of the numeric block, shared by VIF and
+    # IsolationForest (sklearn would otherwise copy to C order itself)
+    n_numeric_rows, n_numeric_cols = numeric.shape
+    filled = np.array(arr, order="C")
+    medians = np.full(n_numeric_cols, np.nan)  # all-null columns stay NaN
+    if some.any():
+        medians[some] = np.nanmedian(arr if some.all() else arr[:, some], axis=0)
+    np.copyto(filled, medians, where=np.isnan(filled))
+
     # Multicollinearity (VIF)
     try:
-        vifs = _vif(df)
+        vifs = _vif(filled, profile.numeric_cols) if n_numeric_cols >= VIF_MIN_COLUMNS and n_numeric_rows >= VIF_MIN_ROWS else {}
         for col, v in vifs.items():
             if v > 10:
                 high_vif.append(col)
@@ -109,15 +166,31 @@ def evaluate_analytical(profile: DatasetProfile) -> AnalyticalResult:
         pass
 
     # Missing burden
-    missing_ratio = df.isna().sum().sum() / (n_rows * n_cols) if (n_rows * n_cols) > 0 else 0
+    missing_ratio = profile.null_mask.mean() if profile.null_mask.size else 0
     prep_complexity += missing_ratio * 0.5
 
     # Optional: Isolation Forest anomaly density
-    if HAS_SKLEARN and numeric.shape[0] > 10 and numeric.shape[1] >= 1:
+    if HAS_SKLEARN and n_numeric_rows >= ANOMALY_MIN_ROWS and n_numeric_cols >= ANOMALY_MIN_COLUMNS:
         try:
-            X = numeric.fillna(numeric.median())
-            X = StandardScaler().fit_transform(X)
-            iso = IsolationForest(random_state=42, contamination=0.1).fit(X)
+            from sklearn.ensemble import IsolationForest
+
+            # float32 is what the trees use internally; standardize in place
+            X = filled
+            if len(X) > ANOMALY_MAX_ROWS:
+                rng = np.random.default_rng(42)
+                X = X[rng.choice(len(X), ANOMALY_MAX_ROWS, replace=False)]
+            X = X.astype(np.float32)
+            with np.errstate(invalid="ignore"):  # inf columns turn NaN, rejected by fit() below
+                X -= X.mean(axis=0)
+                scale = X.std(axis=0)
+            scale[scale == 0] = 1.0
+            X /= scale
+            iso = IsolationForest(
+                max_samples=min(256, len(X)),
+                contamination=0.1,
+                n_jobs=-1,
+                random_state=42,
+            ).fit(X)
             pred = iso.predict(X)
             anomaly_density = (pred == -1).sum() / len(pred)
         except Exception:
@@ -3,11 +3,19 @@
 from __future__ import annotations
 
 import re
+from functools import lru_cache
+
 import pandas as pd
 
 from edet.models.profile import DatasetProfile
 from edet.models.scores import GovernanceResult, SensitivityLevel
 
+try:
+    import hyperscan
+    HAS_HYPERSCAN = True
+except ImportError:
+    HAS_HYPERSCAN = False
+
 
 # Regex patterns for PII and sensitive data
 PII_PATTERNS = {
@@ -18,32 +26,93 @@ PII_PATTERNS = {
     "iban": re.compile(r"\b[A-Z]{2}\d{2}\s?\d{4}\s?\d{4}\s?\d{4}\s?\d{4}\s?\d{0,4}\b"),
     "ip_address": re.compile(r"\b\d{1,3}\.\d{1,3}\.\d{1,3}\.\d{1,3}\b"),
 }
+PATTERN_NAMES = list(PII_PATTERNS)
+
+# Values scanned per column; drawn at random so sorted data is covered evenly
+PII_SAMPLE_SIZE = 1000
+
+# Sample values are joined into one buffer and scanned in a single pass.
+# NUL is neither whitespace nor a word character, so no pattern can match
+# across two values.
+_VALUE_SEP = "\x00"
+
+if HAS_HYPERSCAN:
+    HS_DB = hyperscan.Database()
+    HS_DB.compile(
+        expressions=[p.pattern.encode() for p in PII_PATTERNS.values()],
+        ids=list(range(len(PATTERN_NAMES))),
+        elements=len(PATTERN_NAMES),
+        flags=[hyperscan.HS_FLAG_SINGLEMATCH] * len(PATTERN_NAMES),
+    )
 
-# Column name hints for high-risk attributes
+# Column name hints for high-risk attributes (literal substrings of the lowercased name)
 SENSITIVE_NAME_PATTERNS = [
-    r"password", r"passwd", r"pwd", r"secret", r"token", r"api_key",
-    r"ssn", r"social", r"tax_id", r"nin", r"dob", r"birth_date",
-    r"salary", r"income", r"bank_account", r"credit_card", r"cvv",
-    r"email", r"phone", r"address", r"name", r"first_name", r"last_name",
+    "password", "passwd", "pwd", "secret", "token", "api_key",
+    "ssn", "social", "tax_id", "nin", "dob", "birth_date",
+    "salary", "income", "bank_account", "credit_card", "cvv",
+    "email", "phone", "address", "name", "first_name", "last_name",
 ]
 
 
 def _column_name_risk(col: str) -> list[str]:
-    hits = []
     col_lower = col.lower()
-    for pat in SENSITIVE_NAME_PATTERNS:
-        if re.search(pat, col_lower):
-            hits.append(f"name:{pat}")
+    return [f"name:{pat}" for pat in SENSITIVE_NAME_PATTERNS if pat in col_lower]
+
+
+@lru_cache(maxsize=None)
+def _combined_pattern(names: tuple[str, ...]) -> re.Pattern:
+    """Single alternation over the given PII patterns, one named group each."""
+    return re.compile("|".join(f"(?P<{n}>{PII_PATTERNS[n].pattern})" for n in names))
+
+
+def _scan_hyperscan(buf: str) -> set[str]:
+    hits: set[str] = set()
+
+    def on_match(pattern_id, *_):
+        hits.add(PATTERN_NAMES[pattern_id])
+        return len(hits) == len(PATTERN_NAMES)  # truthy stops the scan
+
+    try:
+        # Per-call scratch space: Streamlit sessions may scan concurrently
+        HS_DB.scan(buf.encode(), match_event_handler=on_match, scratch=hyperscan.Scratch(HS_DB))
+    except hyperscan.ScanTerminated:
+        pass
+    return hits
+
+
+def _scan_re(buf: str) -> set[str]:
+    # At a given position the alternation reports only the first group that
+    # matches, so re-search without the patterns already found. No remaining
+    # pattern can match left of the last hit, so each search resumes there
+    # and the buffer is walked once overall (pos keeps \b context intact).
+    hits: set[str] = set()
+    remaining = tuple(PATTERN_NAMES)
+    pos = 0
+    while remaining:
+        m = _combined_pattern(remaining).search(buf, pos)
+        if m is None:
+            break
+        hits.add(m.lastgroup)
+        remaining = tuple(n for n in remaining if n != m.lastgroup)
+        pos = m.start()
     return hits
 
 
 def _detect_patterns_in_series(s: pd.Series) -> list[str]:
-    found = []
-    sample = s.dropna().astype(str).head(1000)
-    for name, pattern in PII_PATTERNS.items():
-        if sample.str.contains(pattern, regex=True).any():
-            found.append(name)
-    return found
+    nonnull = s.dropna()
+    if nonnull.empty:
+        return []
+    if len(nonnull) > PII_SAMPLE_SIZE:
+        nonnull = nonnull.sample(n=PII_SAMPLE_SIZE, random_state=0)
+    values = nonnull.to_numpy()
+    try:
+        buf = _VALUE_SEP.join(values)  # already-str columns (the common case): no conversion
+    except TypeError:
+        buf = _VALUE_SEP.join(map(str, values))
+    # Hyperscan's \b and \d are ASCII-only, while re on str is Unicode-aware:
+    # non-ASCII text goes through re so results do not depend on the backend
+    hits = _scan_hyperscan(buf) if HAS_HYPERSCAN and buf.isascii() else _scan_re(buf)
+    return [name for name in PATTERN_NAMES if name in hits]
 
 
 def evaluate_governance(profile: DatasetProfile) -> GovernanceResult:
@@ -57,6 +126,7 @@ def evaluate_governance(profile: DatasetProfile) -> GovernanceResult:
     max_risk = 0.0
     n_cols = len(df.columns)
     n_rows = len(df)
+    text_cols = set(profile.object_cols)
 
     for col in df.columns:
         reasons: list[str] = []
@@ -64,7 +134,7 @@ def evaluate_governance(profile: DatasetProfile) -> GovernanceResult:
         name_risks = _column_name_risk(col)
         reasons.extend(name_risks)
         # Pattern-based (sample for speed)
-        if df[col].dtype == object or str(df[col].dtype) == "string":
+        if col in text_cols:
             pattern_risks = _detect_patterns_in_series(df[col])
             reasons.extend(pattern_risks)
         if reasons:
@@ -78,7 +148,8 @@ def evaluate_governance(profile: DatasetProfile) -> GovernanceResult:
 
     # Absence of unique key (from structural we could pass candidate PKs; here we just note)
     if n_rows > 0:
-        has_unique = any(df[c].nunique() == n_rows for c in df.columns)
+        # Short-circuits on the first unique column; NaN disqualifies as in nunique() == n_rows
+        has_unique = any(not df[c].hasnans and df[c].is_unique for c in df.columns)
         if not has_unique and n_cols > 0:
             risk_flags.append("No obvious unique identifier; re-identification risk")
 
@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+import datetime
 from pathlib import Path
 from typing import BinaryIO
 
@@ -10,18 +11,78 @@ import pandas as pd
 SUPPORTED_EXTENSIONS = {".csv", ".xlsx", ".xls", ".json", ".txt", ".tsv"}
 
 
+def _pyarrow_divergences(df: pd.DataFrame) -> tuple[bool, list[str]]:
+    """
+    Where a pyarrow-engine result differs from what the C engine would return:
+    whether any header or cell came back as undecoded bytes, and which columns
+    pyarrow inferred as dates, times or timestamps (the C engine keeps those
+    as text).
+    """
+    has_bytes = any(isinstance(c, bytes) for c in df.columns)
+    temporal: list[str] = []
+    for col, dtype in df.dtypes.items():
+        if pd.api.types.is_datetime64_any_dtype(dtype):
+            temporal.append(col)
+        elif dtype == object:
+            first = df[col].first_valid_index()
+            value = df[col].at[first] if first is not None else None
+            if isinstance(value, bytes):
+                has_bytes = True
+            elif isinstance(value, (datetime.date, datetime.time)):
+                temporal.append(col)
+    return has_bytes, temporal
+
+
+def _read_csv(source: Path | BinaryIO, nrows: int | None = None, **kwargs) -> pd.DataFrame:
+    """
+    Read delimited text with the multithreaded pyarrow engine, falling back to
+    the C engine when pyarrow is missing, rejects the input, or a row limit is
+    requested (pyarrow does not support ``nrows``).
+
+    Results are kept identical to the C engine's: duplicate headers (mangled to
+    ``a``, ``a.1`` by the C engine) and text that is not valid UTF-8 (raw
+    ``bytes`` under pyarrow, ``UnicodeDecodeError`` under C) re-read the whole
+    file with the C engine; columns pyarrow inferred as dates, times or
+    timestamps are re-read on their own, as the text the C engine returns.
+    """
+    if nrows is None:
+        try:
+            df = pd.read_csv(source, engine="pyarrow", **kwargs)
+        except (ImportError, ValueError):
+            df = None
+        if df is not None and not df.columns.has_duplicates:
+            has_bytes, temporal = _pyarrow_divergences(df)
+            if not has_bytes and not temporal:
+                return df
+            if not has_bytes and (hasattr(source, "seek") or isinstance(source, Path)):
+                if hasattr(source, "seek"):
+                    source.seek(0)
+                text = pd.read_csv(source, engine="c", usecols=temporal, low_memory=False, **kwargs)
+                if len(text) == len(df):
+                    for col in temporal:
+                        df[col] = text[col]
+                    return df
+        if hasattr(source, "seek"):
+            source.seek(0)
+    return pd.read_csv(source, engine="c", low_memory=False, cache_dates=True, nrows=nrows, **kwargs)
+
+
 def load_dataset(
     source: str | Path | BinaryIO,
     file_type: str | None = None,
+    nrows: int | None = None,
 ) -> tuple[pd.DataFrame, str]:
     """
     Load dataset from file path or file-like object.
 
+    Args:
+        nrows: Optional row limit for CSV/TSV and Excel sources.
+
     Returns:
         (DataFrame, detected_or_given file_type)
     """
     if hasattr(source, "read"):
-        return _load_from_fileobj(source, file_type or "unknown")
+        return _load_from_fileobj(source, file_type or "unknown", nrows)
     path = Path(source)
     if not path.exists():
         raise FileNotFoundError(f"File not found: {path}")
@@ -32,28 +93,32 @@ def load_dataset(
         )
     ft = file_type or ext.lstrip(".")
     if ext == ".csv" or ft == "csv":
-        df = pd.read_csv(path)
+        df = _read_csv(path, nrows)
     elif ext in (".xlsx", ".xls"):
-        df = pd.read_excel(path, engine="openpyxl")
+        df = pd.read_excel(path, engine="openpyxl", nrows=nrows)
     elif ext == ".json":
         df = pd.read_json(path)
         if df.ndim == 1 or (isinstance(df, pd.DataFrame) and len(df.columns) == 1 and df.iloc[:, 0].apply(lambda x: isinstance(x, dict)).all()):
             df = pd.json_normalize(df.iloc[:, 0].tolist() if len(df.columns) == 1 else df.tolist())
     elif ext in (".txt", ".tsv"):
-        df = pd.read_csv(path, sep="\t", on_bad_lines="skip")
+        df = _read_csv(path, nrows, sep="\t", on_bad_lines="skip")
     else:
-        df = pd.read_csv(path)
+        df = _read_csv(path, nrows)
     return df, ft
 
 
-def _load_from_fileobj(fp: BinaryIO, file_type: str) -> tuple[pd.DataFrame, str]:
+def _load_from_fileobj(
+    fp: BinaryIO,
+    file_type: str,
+    nrows: int | None = None,
+) -> tuple[pd.DataFrame, str]:
     """Load from file-like object (e.g. Streamlit upload)."""
     ext = (getattr(fp, "name", "") or "").lower()
     if ext.endswith(".csv"):
-        df = pd.read_csv(fp)
+        df = _read_csv(fp, nrows)
         return df, "csv"
     if ext.endswith(".xlsx") or ext.endswith(".xls"):
-        df = pd.read_excel(fp, engine="openpyxl")
+        df = pd.read_excel(fp, engine="openpyxl", nrows=nrows)
         return df, "xlsx"
     if ext.endswith(".json"):
         df = pd.read_json(fp)
@@ -61,10 +126,10 @@ def _load_from_fileobj(fp: BinaryIO, file_type: str) -> tuple[pd.DataFrame, str]
             df = pd.json_normalize(df.iloc[:, 0].tolist())
         return df, "json"
     if file_type == "csv":
-        df = pd.read_csv(fp)
+        df = _read_csv(fp, nrows)
         return df, "csv"
     if file_type == "json":
         df = pd.read_json(fp)
         return df, "json"
-    df = pd.read_csv(fp)
+    df = _read_csv(fp, nrows)
     return df, file_type or "unknown"
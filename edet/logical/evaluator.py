@@ -10,9 +10,18 @@ from edet.models.profile import DatasetProfile
 from edet.models.scores import LogicalResult
 
 
-def _col_like(name: str, patterns: list[str]) -> bool:
-    n = name.lower()
-    return any(re.search(p, n) for p in patterns)
+# Column-name hints per rule family, matched in one pass. Each family is a
+# zero-width lookahead so a name hinting at several families reports all of them.
+_COLUMN_CLASS_RE = re.compile(
+    r"(?=(?P<revenue>revenue|sales|amount))"
+    r"|(?=(?P<profit>profit|net_income))"
+    r"|(?=(?P<qty>qty|quantity|count))"
+    r"|(?=(?P<id>id|transaction|txn|key))"
+)
+
+
+def _column_classes(name: str) -> set[str]:
+    return {m.lastgroup for m in _COLUMN_CLASS_RE.finditer(name.lower())}
 
 
 def evaluate_logical(profile: DatasetProfile) -> LogicalResult:
@@ -25,39 +34,40 @@ def evaluate_logical(profile: DatasetProfile) -> LogicalResult:
     total_checks = 0
     passed = 0
 
-    numeric = df.select_dtypes(include=[np.number])
-    revenue_cols = [c for c in df.columns if _col_like(c, [r"revenue", r"sales", r"amount"]) and c in numeric.columns]
+    numeric_cols = set(profile.numeric_cols)
+    classes = {c: _column_classes(c) for c in df.columns}
+    revenue_cols = [c for c in df.columns if "revenue" in classes[c] and c in numeric_cols]
     for c in revenue_cols:
         total_checks += 1
-        if (df[c] < 0).sum() > 0:
+        if df[c].lt(0).any():
             violations.append(f"'{c}' has negative values (revenue-like)")
         else:
             passed += 1
 
-    profit_cols = [c for c in df.columns if _col_like(c, [r"profit", r"net_income"]) and c in numeric.columns]
+    profit_cols = [c for c in df.columns if "profit" in classes[c] and c in numeric_cols]
     for rev_c in revenue_cols:
         for pr_c in profit_cols:
             if rev_c == pr_c:
                 continue
             total_checks += 1
-            if (df[pr_c] > df[rev_c]).sum() > 0:
+            if df[pr_c].gt(df[rev_c]).any():
                 violations.append(f"'{pr_c}' > '{rev_c}' in some rows")
             else:
                 passed += 1
 
-    qty_cols = [c for c in df.columns if _col_like(c, [r"qty", r"quantity", r"count"]) and c in numeric.columns]
+    qty_cols = [c for c in df.columns if "qty" in classes[c] and c in numeric_cols]
     for c in qty_cols:
         total_checks += 1
-        if (df[c] < 0).sum() > 0:
+        if df[c].lt(0).any():
             violations.append(f"'{c}' has negative values")
         else:
             passed += 1
 
-    id_cols = [c for c in df.columns if _col_like(c, [r"id", r"transaction", r"txn", r"key"]) and df[c].nunique() > 0]
+    id_cols = [c for c in df.columns if "id" in classes[c] and df[c].notna().any()]
     for c in id_cols:
         if df[c].dtype in (object, "string") or np.issubdtype(df[c].dtype, np.integer):
             total_checks += 1
-            if df[c].duplicated().sum() > 0:
+            if not df[c].is_unique:
                 violations.append(f"'{c}' has duplicates (expected unique)")
             else:
                 passed += 1
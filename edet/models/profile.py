@@ -3,8 +3,10 @@
 from __future__ import annotations
 
 from dataclasses import dataclass, field
+from functools import cached_property
 from typing import Any
 
+import numpy as np
 import pandas as pd
 
 
@@ -26,24 +28,26 @@ def build_input_metadata(df: pd.DataFrame, file_type: str = "unknown") -> InputM
     """Build InputMetadata from a DataFrame."""
     record_count = len(df)
     column_count = len(df.columns)
-    data_types = {c: str(df[c].dtype) for c in df.columns}
+    dtypes = df.dtypes
+    data_types = {c: str(dt) for c, dt in dtypes.items()}
     numeric_cols = df.select_dtypes(include=["number"]).columns
     numeric_density = len(numeric_cols) / column_count if column_count else 0.0
 
     def _has_timestamp() -> bool:
-        for c in df.columns:
-            if pd.api.types.is_datetime64_any_dtype(df[c]):
-                return True
-            s = df[c].dropna().astype(str)
+        if any(pd.api.types.is_datetime64_any_dtype(dt) for dt in dtypes):
+            return True
+        # Numeric columns never stringify to a date; a short head is enough
+        # to answer "is there any timestamp-like column"
+        for c, dt in dtypes.items():
+            if pd.api.types.is_numeric_dtype(dt):
+                continue
+            s = df[c].dropna().head(50).astype(str)
             if s.str.match(r"^\d{4}-\d{2}-\d{2}").any():
                 return True
         return False
 
     def _has_text() -> bool:
-        for c in df.columns:
-            if df[c].dtype == object or (df[c].dtype.name == "string"):
-                return True
-        return False
+        return any(dt == object or dt.name == "string" for dt in dtypes)
 
     return InputMetadata(
         file_type=file_type,
@@ -65,7 +69,24 @@ class DatasetProfile:
     metadata: InputMetadata
     # Optional: normalized view for downstream (e.g. parsed dates)
     working_df: pd.DataFrame | None = None
+    # Last TrustEngine result for this profile (an EvaluationBundle)
+    evaluation: Any = field(default=None, init=False, repr=False, compare=False)
 
     @property
     def df(self) -> pd.DataFrame:
         return self.working_df if self.working_df is not None else self.raw
+
+    # Dtype partitions of df, computed once and shared by all layers
+    @cached_property
+    def numeric_cols(self) -> list[str]:
+        return self.df.select_dtypes(include=["number"]).columns.tolist()
+
+    @cached_property
+    def object_cols(self) -> list[str]:
+        """Object and string (text-like) columns."""
+        return self.df.select_dtypes(include=["object", "string"]).columns.tolist()
+
+    @cached_property
+    def null_mask(self) -> np.ndarray:
+        """Boolean (rows, columns) missing-value mask, materialized once."""
+        return self.df.isna().to_numpy()
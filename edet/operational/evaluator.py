@@ -1,18 +1,33 @@
 """Operational and temporal stability evaluation."""
 
+from datetime import datetime, timezone
+
+import numpy as np
 import pandas as pd
+from pandas.tseries.api import guess_datetime_format
+
 from edet.models.profile import DatasetProfile
 from edet.models.scores import OperationalResult
 
+DATE_PREFIX = r"^\d{4}-\d{2}-\d{2}"
+# Non-null values inspected per text column to detect dates and their format
+DATE_SAMPLE_SIZE = 100
+
 
 def _find_temporal_column(df):
     for col in df.columns:
         if pd.api.types.is_datetime64_any_dtype(df[col]):
             return df[col].dropna()
+    for col in df.columns:
+        if pd.api.types.is_numeric_dtype(df[col]):
+            continue  # numbers never stringify to a date prefix
         try:
-            s = df[col].dropna().astype(str)
-            if s.str.match(r"^\d{4}-\d{2}-\d{2}").any():
-                parsed = pd.to_datetime(df[col], errors="coerce")
+            sample = df[col].dropna().head(DATE_SAMPLE_SIZE).astype(str)
+            matches = sample[sample.str.match(DATE_PREFIX)]
+            if not matches.empty:
+                # An explicit format keeps to_datetime on its vectorized path
+                fmt = guess_datetime_format(matches.iloc[0])
+                parsed = pd.to_datetime(df[col], format=fmt, errors="coerce")
                 return parsed.dropna()
         except Exception:
             pass
@@ -34,10 +49,13 @@ def evaluate_operational(profile: DatasetProfile) -> OperationalResult:
             latest_update_lag_days=None,
         )
 
-    ts = pd.Series(ts).sort_values()
-    latest = ts.max()
-    now = pd.Timestamp.now()
-    latest_lag_days = (now - latest).total_seconds() / 86400
+    # Only the max and the successive diffs are needed: sort the raw values,
+    # not a Series with its index
+    values = np.sort(ts.to_numpy("datetime64[ns]"))  # tz-aware columns become UTC
+    latest = values[-1]
+    # Naive timestamps are taken as local wall time, tz-aware ones against UTC now
+    now = datetime.now(timezone.utc).replace(tzinfo=None) if getattr(ts.dtype, "tz", None) else datetime.now()
+    latest_lag_days = float((np.datetime64(now, "ns") - latest) / np.timedelta64(1, "D"))
     if latest_lag_days > 365:
         flags.append("Data very stale: over 1 year old")
         score -= 0.4
@@ -49,9 +67,11 @@ def evaluate_operational(profile: DatasetProfile) -> OperationalResult:
         score -= 0.1
 
     if len(ts) >= 2:
-        diffs = ts.diff().dropna()
-        if len(diffs) > 0 and diffs.median().total_seconds() > 0:
-            gaps = (diffs > 2 * diffs.median()).sum()
+        # int64 nanosecond diffs: no Timedelta boxing for the median and comparison
+        diffs = np.diff(values.view("i8"))
+        median = np.median(diffs)
+        if median > 0:
+            gaps = int(np.count_nonzero(diffs > 2 * median))
             if gaps > 0:
                 flags.append("Time gaps detected")
                 score -= min(0.2, 0.05 * min(gaps, 4))
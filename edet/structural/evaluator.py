@@ -2,12 +2,112 @@
 
 from __future__ import annotations
 
+from importlib.util import find_spec
+
 import pandas as pd
 import numpy as np
 
 from edet.models.profile import DatasetProfile
 from edet.models.scores import StructuralResult
 
+HAS_PYARROW = find_spec("pyarrow") is not None
+
+# Loose float() grammar: matches every string float() accepts (\d and \s are
+# Unicode-aware, as float() is) and fails on the first character of most text
+_FLOAT_LIKE = r"\s*[+-]?(?:[\d_.]+(?:[eE][+-]?[\d_]+)?|[nN][aA][nN]|[iI][nN][fF](?:[iI][nN][iI][tT][yY])?)\s*"
+
+# Run the hashing checks (duplicates, nunique, value_counts, correlation) on an
+# Arrow-backed copy of the frame. The conversion is paid once per call, so it
+# only helps on wide string-heavy frames; off by default
+ARROW_BACKEND = False
+
+# Above this many numeric columns the k x k correlation matrix is never
+# materialized; it is computed CORR_BLOCK_COLUMNS columns at a time instead
+CORR_BLOCKED_MIN_COLUMNS = 500
+CORR_BLOCK_COLUMNS = 512
+
+
+def _correlated_pairs_blocked(
+    arr: np.ndarray,
+    threshold: float,
+    block: int = CORR_BLOCK_COLUMNS,
+) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Column pairs (i < j, row-major order) with |r| > threshold, using
+    O(k * block) memory. Like DataFrame.corr(), each pair only uses the rows
+    where both columns are present.
+    """
+    # Centering by the column mean leaves r unchanged and limits cancellation
+    has_nan = bool(np.isnan(arr).any())
+    if has_nan:
+        present = ~np.isnan(arr)
+        mean = np.zeros(arr.shape[1])  # all-null columns: fully masked out below
+        some = present.any(axis=0)
+        mean[some] = np.nanmean(arr if some.all() else arr[:, some], axis=0)
+        with np.errstate(invalid="ignore"):
+            X = np.where(present, arr - mean, 0.0)
+        M = present.astype(np.float64)
+        X2 = X * X
+    else:
+        X = arr - arr.mean(axis=0)
+        with np.errstate(divide="ignore", invalid="ignore"):
+            X /= np.sqrt(np.einsum("ij,ij->j", X, X))  # unit columns: X.T @ X is the correlation
+    found_i, found_j, found_r = [], [], []
+    for start in range(0, arr.shape[1], block):
+        stop = min(start + block, arr.shape[1])
+        with np.errstate(divide="ignore", invalid="ignore"):
+            if has_nan:
+                Mb, Xb = M[:, start:stop], X[:, start:stop]
+                n = M.T @ Mb
+                sx, sy = X.T @ Mb, M.T @ Xb
+                sxx, syy = X2.T @ Mb, M.T @ X2[:, start:stop]
+                nxx, nyy = n * sxx, n * syy
+                vx, vy = nxx - sx * sx, nyy - sy * sy
+                r = (n * (X.T @ Xb) - sx * sy) / np.sqrt(vx * vy)
+                # A column constant on the rows shared with the other has no
+                # defined r (NaN, as DataFrame.corr()); relative test because
+                # cancellation leaves a tiny nonzero variance instead of 0
+                r[(vx <= 1e-12 * nxx) | (vy <= 1e-12 * nyy)] = np.nan
+            else:
+                r = X.T @ X[:, start:stop]
+        r = np.abs(r)
+        i, j = np.nonzero(r > threshold)
+        keep = i < j + start
+        found_i.append(i[keep])
+        found_j.append(j[keep] + start)
+        found_r.append(r[i[keep], j[keep]])
+    i, j, r = np.concatenate(found_i), np.concatenate(found_j), np.concatenate(found_r)
+    order = np.lexsort((j, i))
+    return i[order], j[order], r[order]
+
+
+def _all_numeric_arrow(values: pd.Series) -> bool:
+    """
+    True if every string (commas stripped) casts to a finite float with Arrow's
+    vectorized parser. Arrow has no coerce mode, so one bad value fails the whole
+    cast: this only proves the all-numeric case, anything else is left to
+    pd.to_numeric. Non-finite results are not trusted, since Arrow also reads
+    overflow ("1e400") and "nan(...)" forms that pandas rejects.
+    """
+    import pyarrow as pa
+    import pyarrow.compute as pc
+
+    arr = pc.replace_substring(pa.array(values.to_numpy(), type=pa.string()), ",", "")
+    try:
+        parsed = pc.cast(arr, pa.float64())
+    except (pa.ArrowInvalid, pa.ArrowTypeError):
+        return False
+    return pc.all(pc.is_finite(parsed)).as_py()
+
+
+def _looks_numeric(value: str) -> bool:
+    """True if float() accepts the string."""
+    try:
+        float(value)
+        return True
+    except ValueError:
+        return False
+
 
 def evaluate_structural(profile: DatasetProfile) -> StructuralResult:
     """
@@ -19,72 +119,114 @@ def evaluate_structural(profile: DatasetProfile) -> StructuralResult:
     n_rows, n_cols = df.shape
     flags: list[str] = []
     redundant: list[str] = []
+    redundant_set: set[str] = set()  # membership guard: each column is listed once, first-seen order
     candidate_pks: list[str] = []
+    # Dtype classes resolved once per column, reused by every check below
+    is_int = {c: pd.api.types.is_integer_dtype(t) for c, t in df.dtypes.items()}
+    is_obj = {c: pd.api.types.is_object_dtype(t) for c, t in df.dtypes.items()}
+    is_str = {c: isinstance(t, pd.StringDtype) for c, t in df.dtypes.items()}
+    if ARROW_BACKEND and HAS_PYARROW:
+        data = df.convert_dtypes(dtype_backend="pyarrow", convert_integer=False)
+    else:
+        data = df
 
     # --- Schema completeness ---
-    empty_cols = [c for c in df.columns if df[c].isna().all()]
+    null_mask = profile.null_mask
+    null_free = n_rows > 0 and not null_mask.any()  # common clean case: skip NaN handling below
+    if null_free:
+        col_na = np.zeros(n_cols, dtype=np.int64)
+    else:
+        col_na = null_mask.sum(axis=0)
+    empty_cols = df.columns[col_na == n_rows].tolist()
     if empty_cols:
         flags.append(f"Empty columns: {len(empty_cols)} ({', '.join(empty_cols[:5])}{'...' if len(empty_cols) > 5 else ''})")
 
     # --- Missing value density (per column then overall) ---
-    missing_ratio = df.isna().sum().sum() / (n_rows * n_cols) if (n_rows * n_cols) > 0 else 0.0
+    missing_ratio = col_na.sum() / (n_rows * n_cols) if (n_rows * n_cols) > 0 else 0.0
     if missing_ratio > 0.3:
         flags.append(f"High missing value density: {missing_ratio:.1%}")
     elif missing_ratio > 0.1:
         flags.append(f"Moderate missing value density: {missing_ratio:.1%}")
 
     # --- Duplicate rows ---
-    dup_count = df.duplicated().sum()
+    # All-null columns are identical in every row, so leave them out of the hash
+    dup_count = 0
+    if n_rows > 1 and n_cols > 0:
+        key_cols = df.columns[col_na < n_rows]
+        if len(key_cols) == 0:
+            dup_count = n_rows - 1
+        elif len(key_cols) == 1:
+            dup_count = int(data[key_cols[0]].duplicated().sum())  # Series path is cheaper
+        else:
+            dup_count = int(data.duplicated(subset=key_cols).sum())
     if dup_count > 0:
         pct = dup_count / n_rows if n_rows else 0
         flags.append(f"Duplicate rows: {dup_count} ({pct:.1%})")
 
     # --- Identifier uniqueness & candidate primary keys ---
-    for col in df.columns:
-        if df[col].dtype in ("object", "string", "int64", "int32") or "int" in str(df[col].dtype):
-            uniq = df[col].nunique()
-            if uniq == n_rows and n_rows > 0 and df[col].notna().all():
+    nuniques = data.nunique()  # one call for all columns, reused below
+    for (col, uniq), na in zip(nuniques.items(), col_na):
+        if is_int[col] or is_obj[col] or is_str[col]:
+            if uniq == n_rows and n_rows > 0 and na == 0:
                 candidate_pks.append(col)
             if uniq == 1 and n_rows > 1:
                 redundant.append(col)
+                redundant_set.add(col)
                 flags.append(f"Constant column: {col}")
 
     # --- Near-constant (e.g. >95% one value) ---
-    for col in df.columns:
-        if col in redundant:
-            continue
-        vc = df[col].value_counts(dropna=False)
-        if len(vc) > 0 and vc.iloc[0] / n_rows >= 0.95 and n_rows > 10:
-            redundant.append(col)
-            flags.append(f"Near-constant column: {col} ({vc.index[0]})")
+    if n_rows > 10:
+        for col, uniq in nuniques.items():
+            # The top value covers at most n_rows - (uniq - 1) rows
+            if col in redundant_set or n_rows - (uniq - 1) < 0.95 * n_rows:
+                continue
+            counts = data[col].value_counts(dropna=False, sort=False)
+            top = counts.to_numpy().argmax()  # first of the most frequent, as nlargest(1)
+            if counts.iat[top] / n_rows >= 0.95:
+                redundant.append(col)
+                redundant_set.add(col)
+                flags.append(f"Near-constant column: {col} ({counts.index[top]})")
 
     # --- Correlation redundancy (highly correlated numeric pairs) ---
-    num_df = df.select_dtypes(include=[np.number])
-    if num_df.shape[1] >= 2:
-        corr = num_df.corr().abs()
-        np.fill_diagonal(corr.values, 0)
-        for i, c1 in enumerate(num_df.columns):
-            for j, c2 in enumerate(num_df.columns):
-                if i < j and corr.iloc[i, j] > 0.95:
-                    redundant.append(c1)
-                    redundant.append(c2)
-                    flags.append(f"High correlation redundancy: {c1} ~ {c2} (r={corr.iloc[i, j]:.2f})")
-    redundant = list(dict.fromkeys(redundant))  # deduplicate while preserving order
+    num_df = data[profile.numeric_cols]
+    if num_df.shape[1] >= 2 and n_rows >= 2:  # no correlation is defined on fewer rows
+        arr = num_df.to_numpy(dtype=np.float64, na_value=np.nan)
+        if num_df.shape[1] > CORR_BLOCKED_MIN_COLUMNS:
+            rows, cols, r_vals = _correlated_pairs_blocked(arr, 0.95)
+        else:
+            with np.errstate(divide="ignore", invalid="ignore"):
+                if not null_free and np.isnan(arr).any():
+                    corr = num_df.corr().to_numpy()  # pairwise-complete, as NaN rows need
+                else:
+                    corr = np.corrcoef(arr, rowvar=False)
+            corr = np.abs(corr)
+            # Upper triangle only (k=1 excludes the diagonal); row-major pair order
+            rows, cols = np.nonzero(np.triu(corr > 0.95, k=1))
+            r_vals = corr[rows, cols]
+        names = num_df.columns.to_numpy()
+        for c1, c2, r in zip(names[rows], names[cols], r_vals):
+            for c in (c1, c2):
+                if c not in redundant_set:
+                    redundant_set.add(c)
+                    redundant.append(c)
+            flags.append(f"High correlation redundancy: {c1} ~ {c2} (r={r:.2f})")
 
     # --- Type inconsistency (mixed types in object columns) ---
-    for col in df.select_dtypes(include=["object"]).columns:
-        non_null = df[col].dropna().astype(str)
-        if len(non_null) == 0:
+    for col in (c for c in df.columns if is_obj[c]):
+        # Only the distinct strings need classifying: parse work is O(unique), not O(rows)
+        non_null = df[col] if null_free else df[col].dropna()
+        values = pd.Series(pd.unique(non_null.astype(str)))
+        if len(values) == 0 or (HAS_PYARROW and _all_numeric_arrow(values)):
             continue
-        # Check if column has mixed numeric/non-numeric
-        def looks_numeric(s):
-            try:
-                float(s.replace(",", ""))
-                return True
-            except (ValueError, TypeError):
-                return False
-        num_like = non_null.apply(looks_numeric)
-        if 0 < num_like.sum() < len(non_null):
+        # Check if column has mixed numeric/non-numeric (vectorized parse).
+        # float() also accepts some strings to_numeric rejects ("nan", overflow
+        # such as "1e400", "1_000"); only failures shaped like a float are
+        # re-checked with it, one by one
+        cleaned = values.str.replace(",", "", regex=False)
+        failed = cleaned[pd.to_numeric(cleaned, errors="coerce").isna()]
+        recheck = failed[failed.str.fullmatch(_FLOAT_LIKE)]
+        n_num = len(values) - len(failed) + sum(map(_looks_numeric, recheck))
+        if 0 < n_num < len(values):
             flags.append(f"Type inconsistency in column: {col} (mixed numeric/text)")
 
     # --- Structural Integrity Score (0–1) ---